@@ -1,25 +1,47 @@
 from __future__ import annotations
 
+import math
 import os
 import socket
-from datetime import datetime
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
 
-from typing import Dict, List
+from types import NoneType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Set, Tuple, TypeVar, get_args
 from uuid import UUID
 from decimal import Decimal
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi import Query, Path
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
 from typing import Optional
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from models.person import PersonCreate, PersonRead, PersonUpdate
 from models.address import AddressCreate, AddressRead, AddressUpdate
-from models.organization import OrganizationCreate, OrganizationRead, OrganizationUpdate
+from models.organization import (
+    OrganizationCreate,
+    OrganizationRead,
+    OrganizationUpdate,
+    resolve_models,
+)
 from models.course import CourseCreate, CourseRead, CourseUpdate
 from models.health import Health
 
+# LAZY_MODELS leaves the organization models' AddressBase reference unbound;
+# the routes below build their schemas, so resolve it before declaring them.
+resolve_models()
+
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
+# Resolved once at import; a hostname lookup per /health hit blocks on NSS/DNS.
+try:
+    _LOCAL_IP = socket.gethostbyname(socket.gethostname())
+except OSError:
+    _LOCAL_IP = "127.0.0.1"
+
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
 # -----------------------------------------------------------------------------
@@ -28,6 +50,149 @@ addresses: Dict[UUID, AddressRead] = {}
 organizations: Dict[UUID, OrganizationRead] = {}
 courses: Dict[UUID, CourseRead] = {}
 
+# Handlers are `async def` and never await while touching the stores, so each
+# write, index maintenance included, runs atomically on the event loop.
+
+# Secondary indexes for the exact-match filters, kept in sync by the write
+# handlers so list endpoints can narrow candidates without scanning.
+# Buckets are dicts used as insertion-ordered sets (values are unused).
+persons_by_uni: Dict[str, Dict[UUID, None]] = defaultdict(dict)
+addresses_by_city: Dict[str, Dict[UUID, None]] = defaultdict(dict)
+organizations_by_contact: Dict[UUID, Dict[UUID, None]] = defaultdict(dict)
+courses_by_code: Dict[str, Dict[UUID, None]] = defaultdict(dict)
+courses_by_sem_year: Dict[Tuple[str, int], Dict[UUID, None]] = defaultdict(dict)
+courses_by_instructor: Dict[UUID, Dict[UUID, None]] = defaultdict(dict)
+
+# Creation sequence number of every ID, one map per store (address IDs are
+# client-supplied and may collide with other stores' IDs). An update that
+# changes an indexed key appends the ID to its new bucket, so narrowed lookups
+# sort by this to come back in creation order, like a full scan of the store.
+persons_order: Dict[UUID, int] = {}
+addresses_order: Dict[UUID, int] = {}
+organizations_order: Dict[UUID, int] = {}
+courses_order: Dict[UUID, int] = {}
+
+# Responses are encoded straight to JSON bytes by pydantic-core. FastAPI hands
+# a returned Response through untouched, so the response_model declared on each
+# route only documents the schema and is never dumped or re-validated.
+_PERSON_LIST_ADAPTER = TypeAdapter(List[PersonRead])
+_ADDRESS_LIST_ADAPTER = TypeAdapter(List[AddressRead])
+_ORGANIZATION_LIST_ADAPTER = TypeAdapter(List[OrganizationRead])
+_COURSE_LIST_ADAPTER = TypeAdapter(List[CourseRead])
+_COURSE_CREATE_LIST_ADAPTER = TypeAdapter(List[CourseCreate])
+
+M = TypeVar("M", bound=BaseModel)
+IndexSpec = Tuple[Dict[Any, Dict[UUID, None]], Callable[[Any], Hashable]]
+Predicate = Callable[[Any], bool]
+
+_PERSON_INDEXES: Tuple[IndexSpec, ...] = ((persons_by_uni, lambda p: p.uni),)
+_ADDRESS_INDEXES: Tuple[IndexSpec, ...] = ((addresses_by_city, lambda a: a.city),)
+_ORGANIZATION_INDEXES: Tuple[IndexSpec, ...] = (
+    (organizations_by_contact, lambda o: o.contact_person_id),
+)
+_COURSE_INDEXES: Tuple[IndexSpec, ...] = (
+    (courses_by_code, lambda c: c.course_code),
+    (courses_by_sem_year, lambda c: (c.semester, c.year)),
+    (courses_by_instructor, lambda c: c.instructor_id),
+)
+
+def _reindex(
+    indexes: Tuple[IndexSpec, ...], order: Dict[UUID, int], item: Any, previous: Any = None
+) -> None:
+    """Move ``item.id`` into the buckets for ``item``, out of those for ``previous``.
+
+    ``order`` is the store's creation-sequence map; new items are appended to it.
+    """
+    if previous is None:
+        order.setdefault(item.id, len(order))
+    for index, key_of in indexes:
+        new_key = key_of(item)
+        old_key = key_of(previous) if previous is not None else None
+        if old_key == new_key:
+            continue
+        bucket = index.get(old_key)
+        if bucket is not None:
+            bucket.pop(item.id, None)
+            if not bucket:
+                del index[old_key]
+        if new_key is not None:
+            index[new_key][item.id] = None
+
+def _lookup(
+    order: Dict[UUID, int], *matches: Tuple[Dict[Any, Dict[UUID, None]], Any]
+) -> Optional[List[UUID]]:
+    """IDs in every index bucket of the supplied exact-match filters, in creation order.
+
+    Filters whose value is None are skipped; returns None when none were
+    supplied, meaning the caller has to scan the whole store.
+    """
+    buckets = []
+    for index, key in matches:
+        if key is None:
+            continue
+        bucket = index.get(key)
+        if not bucket:
+            return []
+        buckets.append(bucket)
+    if not buckets:
+        return None
+    buckets.sort(key=len)
+    smallest, others = buckets[0], buckets[1:]
+    candidate_ids = [i for i in smallest if all(i in bucket for bucket in others)]
+    candidate_ids.sort(key=order.__getitem__)
+    return candidate_ids
+
+def _json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(content=content, media_type="application/json", status_code=status_code)
+
+def _model_response(obj: BaseModel, status_code: int = 200) -> Response:
+    return _json_response(obj.__pydantic_serializer__.to_json(obj), status_code)
+
+# Per model, the fields whose annotation does not admit None.
+_NON_NULLABLE_FIELDS: Dict[type, frozenset] = {}
+
+def _non_nullable_fields(model: type) -> frozenset:
+    names = _NON_NULLABLE_FIELDS.get(model)
+    if names is None:
+        names = _NON_NULLABLE_FIELDS[model] = frozenset(
+            name for name, field in model.model_fields.items()
+            if field.annotation is not NoneType and NoneType not in get_args(field.annotation)
+        )
+    return names
+
+def _apply_update(previous: M, update: BaseModel, **overrides: Any) -> M:
+    """Merge the fields explicitly set on ``update`` into a copy of ``previous``.
+
+    Both models were already validated, so the result is assembled with
+    ``model_construct`` instead of re-validating a ``model_dump()`` round trip.
+    ``overrides`` replace patched values that need reshaping for the stored model.
+    The update models make every field Optional, so an explicit null is checked
+    here against the stored model before anything is written.
+    """
+    model = type(previous)
+    patch = {name: getattr(update, name) for name in update.model_fields_set}
+    non_nullable = _non_nullable_fields(model)
+    cleared = sorted(name for name, value in patch.items() if value is None and name in non_nullable)
+    if cleared:
+        raise HTTPException(status_code=400, detail=f"Field(s) cannot be null: {', '.join(cleared)}")
+    return model.model_construct(**{**previous.__dict__, **patch, **overrides, "updated_at": datetime.now(timezone.utc)})
+
+def _predicates(table: Dict[str, Callable[[Any], Predicate]], **filters: Any) -> List[Predicate]:
+    """Build row predicates from ``table`` for the filters that were supplied."""
+    return [table[name](value) for name, value in filters.items() if value is not None]
+
+def _select(rows: Iterable[Any], preds: List[Predicate]) -> List[Any]:
+    """Return the rows matching every predicate, in a single pass.
+
+    ``rows`` is consumed lazily (a dict view or a map over candidate IDs), so
+    the only list allocated is the result.
+    """
+    if not preds:
+        return list(rows)
+    if len(preds) == 1:
+        return list(filter(preds[0], rows))
+    return [row for row in rows if all(p(row) for p in preds)]
+
 app = FastAPI(
     title="Person/Address/Organization/Course API",
     description="Demo FastAPI app using Pydantic v2 models for Person, Address, Organization, and Course management",
@@ -38,88 +203,116 @@ app = FastAPI(
 # Health endpoints
 # -----------------------------------------------------------------------------
 
+_health_timestamp: Tuple[int, str] = (0, "")
+
+def _utc_timestamp() -> str:
+    """Second-resolution UTC timestamp, formatted at most once per second."""
+    global _health_timestamp
+    now = int(time.time())
+    if now != _health_timestamp[0]:
+        _health_timestamp = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _health_timestamp[1]
+
 def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
     return Health(
         status=200,
         status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
+        timestamp=_utc_timestamp(),
+        ip_address=_LOCAL_IP,
         echo=echo,
         path_echo=path_echo
     )
 
 @app.get("/health", response_model=Health)
-def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
-    return make_health(echo=echo, path_echo=None)
+async def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
+    return _model_response(make_health(echo=echo, path_echo=None))
 
 @app.get("/health/{path_echo}", response_model=Health)
-def get_health_with_path(
+async def get_health_with_path(
     path_echo: str = Path(..., description="Required echo in the URL path"),
     echo: str | None = Query(None, description="Optional echo string"),
 ):
-    return make_health(echo=echo, path_echo=path_echo)
+    return _model_response(make_health(echo=echo, path_echo=path_echo))
 
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
 
 @app.post("/addresses", response_model=AddressRead, status_code=201)
-def create_address(address: AddressCreate):
+async def create_address(address: AddressCreate):
     if address.id in addresses:
         raise HTTPException(status_code=400, detail="Address with this ID already exists")
-    addresses[address.id] = AddressRead(**address.model_dump())
-    return addresses[address.id]
+    # AddressRead only adds the server timestamps on top of AddressCreate.
+    now = datetime.now(timezone.utc)
+    addresses[address.id] = AddressRead.model_construct(**address.__dict__, created_at=now, updated_at=now)
+    _reindex(_ADDRESS_INDEXES, addresses_order, addresses[address.id])
+    return _model_response(addresses[address.id], status_code=201)
+
+_ADDRESS_PREDICATES: Dict[str, Callable[[Any], Predicate]] = {
+    "street": lambda v: lambda a: a.street == v,
+    "state": lambda v: lambda a: a.state == v,
+    "postal_code": lambda v: lambda a: a.postal_code == v,
+    "country": lambda v: lambda a: a.country == v,
+}
 
 @app.get("/addresses", response_model=List[AddressRead])
-def list_addresses(
+async def list_addresses(
     street: Optional[str] = Query(None, description="Filter by street"),
     city: Optional[str] = Query(None, description="Filter by city"),
     state: Optional[str] = Query(None, description="Filter by state/region"),
     postal_code: Optional[str] = Query(None, description="Filter by postal code"),
     country: Optional[str] = Query(None, description="Filter by country"),
 ):
-    results = list(addresses.values())
-
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
-    if country is not None:
-        results = [a for a in results if a.country == country]
-
-    return results
+    candidate_ids = _lookup(addresses_order, (addresses_by_city, city))
+    if candidate_ids is None:
+        rows = addresses.values()
+    else:
+        rows = map(addresses.__getitem__, candidate_ids)
+
+    preds = _predicates(
+        _ADDRESS_PREDICATES, street=street, state=state, postal_code=postal_code, country=country
+    )
+    return _json_response(_ADDRESS_LIST_ADAPTER.dump_json(_select(rows, preds)))
 
 @app.get("/addresses/{address_id}", response_model=AddressRead)
-def get_address(address_id: UUID):
+async def get_address(address_id: UUID):
     if address_id not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    return addresses[address_id]
+    return _model_response(addresses[address_id])
 
 @app.patch("/addresses/{address_id}", response_model=AddressRead)
-def update_address(address_id: UUID, update: AddressUpdate):
+async def update_address(address_id: UUID, update: AddressUpdate):
     if address_id not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    stored = addresses[address_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    addresses[address_id] = AddressRead(**stored)
-    return addresses[address_id]
+    previous = addresses[address_id]
+    addresses[address_id] = _apply_update(previous, update)
+    _reindex(_ADDRESS_INDEXES, addresses_order, addresses[address_id], previous)
+    return _model_response(addresses[address_id])
 
 # -----------------------------------------------------------------------------
 # Person endpoints
 # -----------------------------------------------------------------------------
 
 @app.post("/persons", response_model=PersonRead, status_code=201)
-def create_person(person: PersonCreate):
-    person_read = PersonRead(**person.model_dump())
+async def create_person(person: PersonCreate):
+    person_read = PersonRead.model_construct(**person.__dict__)
     persons[person_read.id] = person_read
-    return person_read
+    _reindex(_PERSON_INDEXES, persons_order, person_read)
+    return _model_response(person_read, status_code=201)
+
+_PERSON_PREDICATES: Dict[str, Callable[[Any], Predicate]] = {
+    "first_name": lambda v: lambda p: p.first_name == v,
+    "last_name": lambda v: lambda p: p.last_name == v,
+    "email": lambda v: lambda p: p.email == v,
+    "phone": lambda v: lambda p: p.phone == v,
+    "birth_date": lambda v: lambda p: str(p.birth_date) == v,
+    # nested address filtering
+    "city": lambda v: lambda p: v in p.city_set,
+    "country": lambda v: lambda p: v in p.country_set,
+}
 
 @app.get("/persons", response_model=List[PersonRead])
-def list_persons(
+async def list_persons(
     uni: Optional[str] = Query(None, description="Filter by Columbia UNI"),
     first_name: Optional[str] = Query(None, description="Filter by first name"),
     last_name: Optional[str] = Query(None, description="Filter by last name"),
@@ -129,56 +322,67 @@ def list_persons(
     city: Optional[str] = Query(None, description="Filter by city of at least one address"),
     country: Optional[str] = Query(None, description="Filter by country of at least one address"),
 ):
-    results = list(persons.values())
-
-    if uni is not None:
-        results = [p for p in results if p.uni == uni]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.addresses)]
-    if country is not None:
-        results = [p for p in results if any(addr.country == country for addr in p.addresses)]
-
-    return results
+    candidate_ids = _lookup(persons_order, (persons_by_uni, uni))
+    if candidate_ids is None:
+        rows = persons.values()
+    else:
+        rows = map(persons.__getitem__, candidate_ids)
+
+    preds = _predicates(
+        _PERSON_PREDICATES,
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        phone=phone,
+        birth_date=birth_date,
+        city=city,
+        country=country,
+    )
+    return _json_response(_PERSON_LIST_ADAPTER.dump_json(_select(rows, preds)))
 
 @app.get("/persons/{person_id}", response_model=PersonRead)
-def get_person(person_id: UUID):
+async def get_person(person_id: UUID):
     if person_id not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    return persons[person_id]
+    return _model_response(persons[person_id])
 
 @app.patch("/persons/{person_id}", response_model=PersonRead)
-def update_person(person_id: UUID, update: PersonUpdate):
+async def update_person(person_id: UUID, update: PersonUpdate):
     if person_id not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    stored = persons[person_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    persons[person_id] = PersonRead(**stored)
-    return persons[person_id]
+    previous = persons[person_id]
+    persons[person_id] = _apply_update(previous, update)
+    _reindex(_PERSON_INDEXES, persons_order, persons[person_id], previous)
+    return _model_response(persons[person_id])
 
 # -----------------------------------------------------------------------------
 # Organization endpoints
 # -----------------------------------------------------------------------------
 
 @app.post("/organizations", response_model=OrganizationRead, status_code=201)
-def create_organization(organization: OrganizationCreate):
-    organization_read = OrganizationRead(**organization.model_dump())
+async def create_organization(organization: OrganizationCreate):
+    organization_read = OrganizationRead.model_construct(
+        **{**organization.__dict__, "addresses": tuple(organization.addresses)}
+    )
     organizations[organization_read.id] = organization_read
-    return organization_read
+    _reindex(_ORGANIZATION_INDEXES, organizations_order, organization_read)
+    return _json_response(organization_read.to_json_bytes(), status_code=201)
+
+def _name_contains(value: str) -> Predicate:
+    needle = value.lower()
+    return lambda o: needle in o.name_lower
+
+_ORGANIZATION_PREDICATES: Dict[str, Callable[[Any], Predicate]] = {
+    "name": _name_contains,
+    "org_type": lambda v: lambda o: o.org_type == v,
+    "founded_year": lambda v: lambda o: o.founded_year == v,
+    # nested address filtering
+    "city": lambda v: lambda o: v in o.city_set,
+    "country": lambda v: lambda o: v in o.country_set,
+}
 
 @app.get("/organizations", response_model=List[OrganizationRead])
-def list_organizations(
+async def list_organizations(
     name: Optional[str] = Query(None, description="Filter by organization name"),
     org_type: Optional[str] = Query(None, description="Filter by organization type"),
     founded_year: Optional[int] = Query(None, description="Filter by founding year"),
@@ -186,63 +390,204 @@ def list_organizations(
     country: Optional[str] = Query(None, description="Filter by country of at least one address"),
     contact_person_id: Optional[UUID] = Query(None, description="Filter by contact person ID"),
 ):
-    results = list(organizations.values())
-
-    if name is not None:
-        results = [o for o in results if name.lower() in o.name.lower()]
-    if org_type is not None:
-        results = [o for o in results if o.org_type == org_type]
-    if founded_year is not None:
-        results = [o for o in results if o.founded_year == founded_year]
-    if contact_person_id is not None:
-        results = [o for o in results if o.contact_person_id == contact_person_id]
-
-    # nested address filtering
-    if city is not None:
-        results = [o for o in results if any(addr.city == city for addr in o.addresses)]
-    if country is not None:
-        results = [o for o in results if any(addr.country == country for addr in o.addresses)]
-
-    return results
+    candidate_ids = _lookup(organizations_order, (organizations_by_contact, contact_person_id))
+    if candidate_ids is None:
+        rows = organizations.values()
+    else:
+        rows = map(organizations.__getitem__, candidate_ids)
+
+    preds = _predicates(
+        _ORGANIZATION_PREDICATES,
+        name=name,
+        org_type=org_type,
+        founded_year=founded_year,
+        city=city,
+        country=country,
+    )
+    return _json_response(_ORGANIZATION_LIST_ADAPTER.dump_json(_select(rows, preds)))
 
 @app.get("/organizations/{organization_id}", response_model=OrganizationRead)
-def get_organization(organization_id: UUID):
+async def get_organization(organization_id: UUID):
     if organization_id not in organizations:
         raise HTTPException(status_code=404, detail="Organization not found")
-    return organizations[organization_id]
+    return _json_response(organizations[organization_id].to_json_bytes())
 
 @app.patch("/organizations/{organization_id}", response_model=OrganizationRead)
-def update_organization(organization_id: UUID, update: OrganizationUpdate):
+async def update_organization(organization_id: UUID, update: OrganizationUpdate):
     if organization_id not in organizations:
         raise HTTPException(status_code=404, detail="Organization not found")
-    stored = organizations[organization_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    organizations[organization_id] = OrganizationRead(**stored)
-    return organizations[organization_id]
+    previous = organizations[organization_id]
+    overrides = {} if update.addresses is None else {"addresses": tuple(update.addresses)}
+    organizations[organization_id] = _apply_update(previous, update, **overrides)
+    _reindex(_ORGANIZATION_INDEXES, organizations_order, organizations[organization_id], previous)
+    return _json_response(organizations[organization_id].to_json_bytes())
 
 # -----------------------------------------------------------------------------
 # Course endpoints
 # -----------------------------------------------------------------------------
 
+# COURSE_COLUMNAR_SCAN=1 mirrors the numeric course fields into numpy arrays so
+# year/credit filters over a large catalog run as vectorized masks. numpy is
+# only imported when the flag is set; small deployments never pay for it.
+COURSE_COLUMNAR_SCAN = os.environ.get("COURSE_COLUMNAR_SCAN") == "1"
+if COURSE_COLUMNAR_SCAN:
+    import numpy as np
+
+class _CourseColumns:
+    """Struct-of-arrays mirror of ``courses`` holding ``year`` and ``credits_x10``."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.size = 0
+        self.ids: List[UUID] = []
+        self.rows: Dict[UUID, int] = {}
+        self.years = np.empty(capacity, dtype=np.int16)
+        self.credits_x10 = np.empty(capacity, dtype=np.int16)
+
+    def upsert(self, course: CourseRead) -> None:
+        row = self.rows.get(course.id)
+        if row is None:
+            if self.size == len(self.years):
+                self._grow()
+            row = self.size
+            self.size += 1
+            self.rows[course.id] = row
+            self.ids.append(course.id)
+        self.years[row] = course.year
+        self.credits_x10[row] = course.credits_x10
+
+    def _grow(self) -> None:
+        for name in ("years", "credits_x10"):
+            old = getattr(self, name)
+            new = np.empty(2 * len(old), dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+
+    def scan(
+        self,
+        year: Optional[int],
+        credits: Optional[Decimal],
+        min_credits: Optional[Decimal],
+        max_credits: Optional[Decimal],
+    ) -> List[UUID]:
+        """IDs (in insertion order) of the courses matching the numeric filters."""
+        years = self.years[: self.size]
+        credits_x10 = self.credits_x10[: self.size]
+        mask = np.ones(self.size, dtype=np.bool_)
+        if year is not None:
+            mask &= years == year
+        # An exact credit value is the range [value, value]; a value finer than
+        # one decimal place yields ceil > floor and so matches nothing.
+        for low in (credits, min_credits):
+            if low is not None:
+                mask &= credits_x10 >= math.ceil(low * 10)
+        for high in (credits, max_credits):
+            if high is not None:
+                mask &= credits_x10 <= math.floor(high * 10)
+        return [self.ids[i] for i in np.flatnonzero(mask)]
+
+_course_columns: Optional[_CourseColumns] = _CourseColumns() if COURSE_COLUMNAR_SCAN else None
+
+def _store_course(course: CourseRead, previous: Optional[CourseRead] = None) -> None:
+    """Put ``course`` into the store, its secondary indexes and the column mirror."""
+    courses[course.id] = course
+    _reindex(_COURSE_INDEXES, courses_order, course, previous)
+    if _course_columns is not None:
+        _course_columns.upsert(course)
+
+def _course_conflicts(
+    course_code: str, semester: str, year: int, course_id: Optional[UUID] = None
+) -> List[UUID]:
+    """IDs of other courses already offering ``course_code`` in that semester and year."""
+    conflicts = _lookup(
+        courses_order, (courses_by_code, course_code), (courses_by_sem_year, (semester, year))
+    ) or []
+    return [i for i in conflicts if i != course_id]
+
 @app.post("/courses", response_model=CourseRead, status_code=201)
-def create_course(course: CourseCreate):
+async def create_course(course: CourseCreate):
     # Check if course code already exists for the same semester/year
-    existing = [c for c in courses.values() 
-                if c.course_code == course.course_code 
-                and c.semester == course.semester 
-                and c.year == course.year]
-    if existing:
+    if _course_conflicts(course.course_code, course.semester, course.year):
         raise HTTPException(
-            status_code=400, 
+            status_code=400,
             detail=f"Course {course.course_code} already exists for {course.semester} {course.year}"
         )
-    
-    course_read = CourseRead(**course.model_dump())
-    courses[course_read.id] = course_read
-    return course_read
+
+    course_read = CourseRead.model_construct(**course.__dict__)
+    _store_course(course_read)
+    return _model_response(course_read, status_code=201)
+
+@app.post(
+    "/courses:batch",
+    response_model=List[CourseRead],
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/CourseCreate"}}
+                }
+            },
+        }
+    },
+)
+async def create_courses_batch(request: Request):
+    """Create several courses at once; either all of them are stored or none."""
+    try:
+        batch = _COURSE_CREATE_LIST_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        )
+
+    seen: Set[Tuple[str, str, int]] = set()
+    for course in batch:
+        key = (course.course_code, course.semester, course.year)
+        if key in seen or _course_conflicts(*key):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Course {course.course_code} already exists for {course.semester} {course.year}"
+            )
+        seen.add(key)
+
+    created = [CourseRead.model_construct(**course.__dict__) for course in batch]
+    for course_read in created:
+        _store_course(course_read)
+    return _json_response(_COURSE_LIST_ADAPTER.dump_json(created), status_code=201)
+
+def _title_contains(value: str) -> Predicate:
+    needle = value.lower()
+    return lambda c: needle in c.title_lower
+
+# Credit filters compare CourseRead.credits_x10; the query bound is scaled once
+# and rounded toward the side that keeps the original Decimal semantics.
+def _credits_equal(value: Decimal) -> Predicate:
+    scaled = value * 10
+    if scaled != scaled.to_integral_value():
+        return lambda c: False
+    target = int(scaled)
+    return lambda c: c.credits_x10 == target
+
+def _credits_at_least(value: Decimal) -> Predicate:
+    bound = math.ceil(value * 10)
+    return lambda c: c.credits_x10 >= bound
+
+def _credits_at_most(value: Decimal) -> Predicate:
+    bound = math.floor(value * 10)
+    return lambda c: c.credits_x10 <= bound
+
+_COURSE_PREDICATES: Dict[str, Callable[[Any], Predicate]] = {
+    "title": _title_contains,
+    "department_code": lambda v: lambda c: c.department_code == v,
+    "semester": lambda v: lambda c: c.semester == v,
+    "year": lambda v: lambda c: c.year == v,
+    "credits": _credits_equal,
+    "min_credits": _credits_at_least,
+    "max_credits": _credits_at_most,
+}
 
 @app.get("/courses", response_model=List[CourseRead])
-def list_courses(
+async def list_courses(
     course_code: Optional[str] = Query(None, description="Filter by course code"),
     title: Optional[str] = Query(None, description="Filter by course title (partial match)"),
     department_code: Optional[str] = Query(None, description="Filter by department code"),
@@ -253,70 +598,68 @@ def list_courses(
     min_credits: Optional[Decimal] = Query(None, description="Filter by minimum credits"),
     max_credits: Optional[Decimal] = Query(None, description="Filter by maximum credits"),
 ):
-    results = list(courses.values())
-
-    if course_code is not None:
-        results = [c for c in results if c.course_code == course_code]
-    if title is not None:
-        results = [c for c in results if title.lower() in c.title.lower()]
-    if department_code is not None:
-        results = [c for c in results if c.department_code == department_code]
-    if semester is not None:
-        results = [c for c in results if c.semester == semester]
-    if year is not None:
-        results = [c for c in results if c.year == year]
-    if instructor_id is not None:
-        results = [c for c in results if c.instructor_id == instructor_id]
-    if credits is not None:
-        results = [c for c in results if c.credits == credits]
-    if min_credits is not None:
-        results = [c for c in results if c.credits >= min_credits]
-    if max_credits is not None:
-        results = [c for c in results if c.credits <= max_credits]
-
-    return results
+    candidate_ids = _lookup(
+        courses_order,
+        (courses_by_code, course_code),
+        (courses_by_sem_year, (semester, year) if semester is not None and year is not None else None),
+        (courses_by_instructor, instructor_id),
+    )
+    numeric = (year, credits, min_credits, max_credits)
+    if candidate_ids is None and _course_columns is not None and any(v is not None for v in numeric):
+        candidate_ids = _course_columns.scan(*numeric)
+    if candidate_ids is None:
+        rows = courses.values()
+    else:
+        rows = map(courses.__getitem__, candidate_ids)
+
+    preds = _predicates(
+        _COURSE_PREDICATES,
+        title=title,
+        department_code=department_code,
+        semester=semester,
+        year=year,
+        credits=credits,
+        min_credits=min_credits,
+        max_credits=max_credits,
+    )
+    return _json_response(_COURSE_LIST_ADAPTER.dump_json(_select(rows, preds)))
 
 @app.get("/courses/{course_id}", response_model=CourseRead)
-def get_course(course_id: UUID):
+async def get_course(course_id: UUID):
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    return courses[course_id]
+    return _model_response(courses[course_id])
+
+_COURSE_UNIQUE_FIELDS = frozenset({"course_code", "semester", "year"})
 
 @app.patch("/courses/{course_id}", response_model=CourseRead)
-def update_course(course_id: UUID, update: CourseUpdate):
+async def update_course(course_id: UUID, update: CourseUpdate):
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    
+
     # If updating course_code, semester, or year, check for conflicts
-    if any(field in update.model_dump(exclude_unset=True) 
-           for field in ['course_code', 'semester', 'year']):
+    if _COURSE_UNIQUE_FIELDS & update.model_fields_set:
         current_course = courses[course_id]
         new_code = update.course_code or current_course.course_code
         new_semester = update.semester or current_course.semester
         new_year = update.year or current_course.year
-        
-        existing = [c for c in courses.values() 
-                    if c.id != course_id
-                    and c.course_code == new_code 
-                    and c.semester == new_semester 
-                    and c.year == new_year]
-        if existing:
+
+        if _course_conflicts(new_code, new_semester, new_year, course_id):
             raise HTTPException(
                 status_code=400,
                 detail=f"Course {new_code} already exists for {new_semester} {new_year}"
             )
-    
-    stored = courses[course_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    courses[course_id] = CourseRead(**stored)
-    return courses[course_id]
+
+    previous = courses[course_id]
+    _store_course(_apply_update(previous, update), previous)
+    return _model_response(courses[course_id])
 
 # -----------------------------------------------------------------------------
 # Root
 # -----------------------------------------------------------------------------
 
 @app.get("/")
-def root():
+async def root():
     return {
         "message": "Welcome to the Person/Address/Organization/Course API", 
         "endpoints": {
@@ -336,4 +679,6 @@ def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    # FASTAPIACCESSLOG=0 turns off per-request access logging (e.g. for benchmarks).
+    access_log = os.environ.get("FASTAPIACCESSLOG", "1") != "0"
+    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True, access_log=access_log)
\ No newline at end of file
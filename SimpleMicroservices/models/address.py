@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
 from uuid import UUID, uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 
 
@@ -54,6 +55,24 @@ class AddressBase(BaseModel):
     }
 
 
+class AddressSetsMixin:
+    """City/country sets of a read model's embedded ``addresses``.
+
+    Mixed into the person and organization read models; the sets are cached
+    per instance for the ``city``/``country`` list filters.
+    """
+
+    @cached_property
+    def city_set(self) -> frozenset[str]:
+        """Cities of the embedded addresses, cached for address filters."""
+        return frozenset(addr.city for addr in self.addresses)
+
+    @cached_property
+    def country_set(self) -> frozenset[str]:
+        """Countries of the embedded addresses, cached for address filters."""
+        return frozenset(addr.country for addr in self.addresses)
+
+
 class AddressCreate(AddressBase):
     """Creation payload; ID is generated server-side but present in the base model."""
     model_config = {
@@ -108,12 +127,12 @@ class AddressUpdate(BaseModel):
 
 class AddressRead(AddressBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional, List, Annotated
+from functools import cached_property
+from typing import Optional, List, Annotated, Literal
 from uuid import UUID, uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field, StringConstraints
 from decimal import Decimal
 
@@ -16,11 +17,8 @@ CourseCodeType = Annotated[
     )
 ]
 
-# Semester constraints
-SemesterType = Annotated[
-    str,
-    StringConstraints(pattern=r"^(Fall|Spring|Summer)$")
-]
+# Semester constraints (closed set, validated as a literal rather than a regex)
+SemesterType = Literal["Fall", "Spring", "Summer"]
 
 # Department code constraints (e.g., COMS, MATH, PHYS, etc.)
 DepartmentCodeType = Annotated[
@@ -109,7 +107,11 @@ class CourseBase(BaseModel):
         json_schema_extra={"example": "MW 2:40PM-3:55PM"},
     )
 
+    # Course instances are never mutated in place (patches build a new object),
+    # so freezing them is free and makes them safe to share. CourseRead hashes
+    # on its id; the other models hold a prerequisites list and stay unhashable.
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -250,12 +252,12 @@ class CourseRead(CourseBase):
         json_schema_extra={"example": "77777777-7777-4777-8777-777777777777"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
@@ -266,6 +268,21 @@ class CourseRead(CourseBase):
         json_schema_extra={"example": 85},
     )
 
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, cached for case-insensitive title filters."""
+        return self.title.lower()
+
+    @cached_property
+    def credits_x10(self) -> int:
+        """Credits in tenths (one decimal place is enforced), cached for integer comparisons."""
+        return int(self.credits * 10)
+
+    def __hash__(self) -> int:
+        # Equal reads necessarily share an id; hashing only the id keeps the
+        # prerequisites list out of the hash.
+        return hash(self.id)
+
     model_config = {
         "json_schema_extra": {
             "examples": [
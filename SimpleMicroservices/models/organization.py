@@ -1,42 +1,167 @@
 from __future__ import annotations
 
-from typing import Optional, List, Annotated
+import copy
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, List, Annotated, Literal
 from uuid import UUID, uuid4
-from datetime import datetime
-from pydantic import BaseModel, Field, HttpUrl, StringConstraints
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 
-from .address import AddressBase
+from .address import AddressSetsMixin
 
-# Organization type constraints
-OrgTypeType = Annotated[
-    str, 
-    StringConstraints(
-        pattern=r"^(university|company|nonprofit|government|startup|research)$"
-    )
-]
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .address import AddressBase
+
+# Organization type constraints (closed set, validated as a literal rather than a regex)
+OrgType = Literal["university", "company", "nonprofit", "government", "startup", "research"]
+
+# Field constraints shared by OrganizationBase and OrganizationUpdate
+NameStr = Annotated[str, Field(min_length=1, max_length=200)]
+DescriptionStr = Annotated[str, Field(max_length=1000)]
+EmployeeCount = Annotated[int, Field(ge=0)]
+FoundedYear = Annotated[int, Field(ge=1000, le=2030)]
+
+# Website URLs are checked with an anchored pattern on the inbound (Create/Update)
+# models only; the base/read models hold the already-checked plain string.
+WebsiteUrl = Annotated[str, StringConstraints(pattern=r"^https?://\S+$", max_length=2083)]
+
+
+# Last timestamp handed out by _now_cached, as [datetime, time.time() value].
+_NOW_CACHE: list = [None, 0.0]
+
+
+def _now_cached() -> datetime:
+    """Current UTC time, reused for up to a millisecond between calls.
+
+    Used as the timestamp default factory so a burst of reads built in the
+    same instant shares one datetime instead of allocating two apiece.
+    """
+    t = time.time()
+    if t - _NOW_CACHE[1] > 0.001:
+        _NOW_CACHE[0] = datetime.fromtimestamp(t, tz=timezone.utc)
+        _NOW_CACHE[1] = t
+    return _NOW_CACHE[0]
+
+
+# Set PYDANTIC_STRIP_EXAMPLES to build the models without their OpenAPI
+# examples, so production imports skip walking the example payloads.
+_STRIP_EXAMPLES = bool(os.environ.get("PYDANTIC_STRIP_EXAMPLES"))
+
+
+def _org_config(*examples: dict, **settings) -> ConfigDict:
+    """Shared organization model config plus the given OpenAPI examples.
+
+    Unknown keys are rejected, and core schemas are built on first use rather
+    than at import. Examples are omitted when stripped; ``settings`` add
+    per-model config entries.
+    """
+    config = ConfigDict(extra="forbid", defer_build=True, **settings)
+    if not _STRIP_EXAMPLES:
+        config["json_schema_extra"] = {"examples": list(examples)}
+    return config
+
+
+_ORG_BASE_CFG = _org_config(
+    {
+        "name": "Columbia University",
+        "org_type": "university",
+        "website": "https://www.columbia.edu",
+        "description": "Ivy League research university in New York City.",
+        "contact_person_id": "99999999-9999-4999-8999-999999999999",
+        "employee_count": 15000,
+        "founded_year": 1754,
+        "addresses": [
+            {
+                "id": "550e8400-e29b-41d4-a716-446655440000",
+                "street": "116th St & Broadway",
+                "city": "New York", 
+                "state": "NY",
+                "postal_code": "10027",
+                "country": "USA",
+            }
+        ],
+    }
+)
+
+_ORG_CREATE_CFG = _org_config(
+    {
+        "name": "Google LLC",
+        "org_type": "company",
+        "website": "https://www.google.com",
+        "description": "Multinational technology company specializing in Internet-related services.",
+        "contact_person_id": None,
+        "employee_count": 150000,
+        "founded_year": 1998,
+        "addresses": [
+            {
+                "id": "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa",
+                "street": "1600 Amphitheatre Parkway",
+                "city": "Mountain View",
+                "state": "CA", 
+                "postal_code": "94043",
+                "country": "USA",
+            }
+        ],
+    }
+)
+
+_ORG_UPDATE_CFG = _org_config(
+    {"name": "Columbia University in the City of New York"},
+    {"employee_count": 16000},
+    {"description": "Premier Ivy League research institution."},
+)
+
+_ORG_READ_CFG = _org_config(
+    {
+        "id": "88888888-8888-4888-8888-888888888888",
+        "name": "Columbia University",
+        "org_type": "university",
+        "website": "https://www.columbia.edu",
+        "description": "Ivy League research university in New York City.",
+        "contact_person_id": "99999999-9999-4999-8999-999999999999",
+        "employee_count": 15000,
+        "founded_year": 1754,
+        "addresses": [
+            {
+                "id": "550e8400-e29b-41d4-a716-446655440000",
+                "street": "116th St & Broadway",
+                "city": "New York",
+                "state": "NY", 
+                "postal_code": "10027",
+                "country": "USA",
+            }
+        ],
+        "created_at": "2025-01-15T10:20:30Z",
+        "updated_at": "2025-01-16T12:00:00Z",
+    },
+    frozen=True,
+)
 
 
 class OrganizationBase(BaseModel):
-    name: str = Field(
+    name: NameStr = Field(
         ...,
-        min_length=1,
-        max_length=200,
         description="Organization name.",
         json_schema_extra={"example": "Columbia University"},
     )
-    org_type: OrgTypeType = Field(
+    org_type: OrgType = Field(
         ...,
         description="Type of organization (university, company, nonprofit, government, startup, research).",
         json_schema_extra={"example": "university"},
     )
-    website: Optional[HttpUrl] = Field(
+    website: Optional[str] = Field(
         None,
         description="Organization's official website URL.",
         json_schema_extra={"example": "https://www.columbia.edu"},
     )
-    description: Optional[str] = Field(
+    description: Optional[DescriptionStr] = Field(
         None,
-        max_length=1000,
         description="Brief description of the organization.",
         json_schema_extra={
             "example": "Ivy League research university in New York City, founded in 1754."
@@ -47,16 +172,13 @@ class OrganizationBase(BaseModel):
         description="ID of the primary contact person for this organization.",
         json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
     )
-    employee_count: Optional[int] = Field(
+    employee_count: Optional[EmployeeCount] = Field(
         None,
-        ge=0,
         description="Approximate number of employees/members.",
         json_schema_extra={"example": 15000},
     )
-    founded_year: Optional[int] = Field(
+    founded_year: Optional[FoundedYear] = Field(
         None,
-        ge=1000,
-        le=2030,
         description="Year the organization was founded.",
         json_schema_extra={"example": 1754},
     )
@@ -79,84 +201,39 @@ class OrganizationBase(BaseModel):
         },
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "Columbia University",
-                    "org_type": "university",
-                    "website": "https://www.columbia.edu",
-                    "description": "Ivy League research university in New York City.",
-                    "contact_person_id": "99999999-9999-4999-8999-999999999999",
-                    "employee_count": 15000,
-                    "founded_year": 1754,
-                    "addresses": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "street": "116th St & Broadway",
-                            "city": "New York", 
-                            "state": "NY",
-                            "postal_code": "10027",
-                            "country": "USA",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
+    model_config = _ORG_BASE_CFG
 
 
 class OrganizationCreate(OrganizationBase):
     """Creation payload for an Organization."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "Google LLC",
-                    "org_type": "company",
-                    "website": "https://www.google.com",
-                    "description": "Multinational technology company specializing in Internet-related services.",
-                    "contact_person_id": None,
-                    "employee_count": 150000,
-                    "founded_year": 1998,
-                    "addresses": [
-                        {
-                            "id": "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa",
-                            "street": "1600 Amphitheatre Parkway",
-                            "city": "Mountain View",
-                            "state": "CA", 
-                            "postal_code": "94043",
-                            "country": "USA",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
+    website: Optional[WebsiteUrl] = Field(
+        None,
+        description="Organization's official website URL (http or https).",
+        json_schema_extra={"example": "https://www.google.com"},
+    )
+
+    model_config = _ORG_CREATE_CFG
 
 
 class OrganizationUpdate(BaseModel):
     """Partial update for an Organization; supply only fields to change."""
-    name: Optional[str] = Field(
+    name: Optional[NameStr] = Field(
         None,
-        min_length=1,
-        max_length=200,
         description="Organization name.",
         json_schema_extra={"example": "Columbia University in the City of New York"},
     )
-    org_type: Optional[OrgTypeType] = Field(
+    org_type: Optional[OrgType] = Field(
         None,
         description="Type of organization.",
         json_schema_extra={"example": "university"},
     )
-    website: Optional[HttpUrl] = Field(
+    website: Optional[WebsiteUrl] = Field(
         None,
-        description="Organization's official website URL.",
+        description="Organization's official website URL (http or https).",
         json_schema_extra={"example": "https://www.columbia.edu"},
     )
-    description: Optional[str] = Field(
+    description: Optional[DescriptionStr] = Field(
         None,
-        max_length=1000,
         description="Brief description of the organization.",
         json_schema_extra={"example": "Updated description of the organization."},
     )
@@ -165,16 +242,13 @@ class OrganizationUpdate(BaseModel):
         description="ID of the primary contact person.",
         json_schema_extra={"example": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb"},
     )
-    employee_count: Optional[int] = Field(
+    employee_count: Optional[EmployeeCount] = Field(
         None,
-        ge=0,
         description="Approximate number of employees/members.",
         json_schema_extra={"example": 16000},
     )
-    founded_year: Optional[int] = Field(
+    founded_year: Optional[FoundedYear] = Field(
         None,
-        ge=1000,
-        le=2030,
         description="Year the organization was founded.",
         json_schema_extra={"example": 1754},
     )
@@ -195,60 +269,232 @@ class OrganizationUpdate(BaseModel):
         },
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"name": "Columbia University in the City of New York"},
-                {"employee_count": 16000},
-                {"description": "Premier Ivy League research institution."},
-            ]
-        }
-    }
+    model_config = _ORG_UPDATE_CFG
 
 
-class OrganizationRead(OrganizationBase):
+_UPD_FIELDS = frozenset(OrganizationUpdate.model_fields)
+
+
+def build_update(**kw) -> OrganizationUpdate:
+    """Build an OrganizationUpdate from already-validated values, skipping validation.
+
+    Only non-None known fields are marked as set, so this cannot express
+    clearing a field; use the validating constructor for that.
+    """
+    return OrganizationUpdate.model_construct(
+        **{k: v for k, v in kw.items() if v is not None and k in _UPD_FIELDS}
+    )
+
+
+class OrganizationRead(OrganizationBase, AddressSetsMixin):
     """Server representation returned to clients."""
     id: UUID = Field(
         default_factory=uuid4,
         description="Server-generated Organization ID.",
         json_schema_extra={"example": "88888888-8888-4888-8888-888888888888"},
     )
+    # Reads are never mutated in place, so addresses are held as a tuple.
+    addresses: tuple[AddressBase, ...] = Field(
+        (),
+        description="Physical addresses/locations of this organization.",
+        json_schema_extra={
+            "example": [
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440000",
+                    "street": "116th St & Broadway",
+                    "city": "New York",
+                    "state": "NY",
+                    "postal_code": "10027",
+                    "country": "USA",
+                }
+            ]
+        },
+    )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_now_cached,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_now_cached,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "88888888-8888-4888-8888-888888888888",
-                    "name": "Columbia University",
-                    "org_type": "university",
-                    "website": "https://www.columbia.edu",
-                    "description": "Ivy League research university in New York City.",
-                    "contact_person_id": "99999999-9999-4999-8999-999999999999",
-                    "employee_count": 15000,
-                    "founded_year": 1754,
-                    "addresses": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "street": "116th St & Broadway",
-                            "city": "New York",
-                            "state": "NY", 
-                            "postal_code": "10027",
-                            "country": "USA",
-                        }
-                    ],
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z",
-                }
-            ]
-        }
-    }
\ No newline at end of file
+    @classmethod
+    def from_trusted_row(cls, row: dict) -> OrganizationRead:
+        """Build an instance from already-validated stored data, skipping validation.
+
+        Only for rows this service wrote itself (e.g. loaded back from a
+        database); payloads arriving over the API must use ``model_validate``.
+        Rows must hold Python-mode values, as ``model_dump()`` returns them:
+        ``UUID`` ids and ``datetime`` timestamps. JSON-mode rows with string ids
+        or ISO strings are not converted; pass those to ``model_validate``.
+        """
+        from .address import AddressBase
+
+        values = {**row}
+        values["addresses"] = tuple(AddressBase.model_construct(**addr) for addr in row.get("addresses", ()))
+        # Validation hands back the Literal's shared constant; do the same here
+        # so rows loaded in bulk don't each hold their own copy of the type.
+        if "org_type" in row:
+            values["org_type"] = sys.intern(row["org_type"])
+        return cls.model_construct(**values)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes for trusted read paths.
+
+        Goes through the compiled pydantic-core serializer in one call, so the
+        embedded addresses are encoded natively rather than via a Python-level
+        ``model_dump`` round trip.
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
+    @property
+    def created_at_iso(self) -> str:
+        """Creation time as an ISO-8601 UTC string."""
+        return self.created_at.isoformat()
+
+    @property
+    def updated_at_iso(self) -> str:
+        """Last update time as an ISO-8601 UTC string."""
+        return self.updated_at.isoformat()
+
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercased name, cached for case-insensitive name filters."""
+        return self.name.lower()
+
+    def __hash__(self) -> int:
+        # Same id-based hash as CourseRead.
+        return hash(self.id)
+
+    def with_updates(self, **changes) -> OrganizationRead:
+        """Return a copy with ``changes`` applied (instances are frozen).
+
+        The copy is validated, so ``changes`` are coerced like any input (e.g.
+        addresses become a tuple), and it is a fresh instance rather than a
+        ``model_copy``, so the cached filter properties are recomputed instead
+        of carried over stale.
+        """
+        values = {name: getattr(self, name) for name in type(self).model_fields}
+        return type(self).model_validate({**values, **changes})
+
+    model_config = _ORG_READ_CFG
+
+
+# Generated JSON schemas keyed on (model, call arguments). Callers get a deep
+# copy so mutating a returned schema cannot leak into later calls.
+_JSON_SCHEMA_CACHE: dict = {}
+
+
+def _cached_json_schema(cls, *args, **kwargs) -> dict:
+    key = (cls, args, tuple(sorted(kwargs.items())))
+    schema = _JSON_SCHEMA_CACHE.get(key)
+    if schema is None:
+        schema = _JSON_SCHEMA_CACHE[key] = BaseModel.model_json_schema.__func__(cls, *args, **kwargs)
+    return copy.deepcopy(schema)
+
+
+for _model in (OrganizationBase, OrganizationCreate, OrganizationUpdate, OrganizationRead):
+    _model.model_json_schema = classmethod(_cached_json_schema)
+del _model
+
+
+_CREATE_LIST_ADAPTER = TypeAdapter(List[OrganizationCreate], config=ConfigDict(defer_build=True))
+
+
+def validate_many_creates(items: List[dict]) -> List[OrganizationCreate]:
+    """Validate a batch of creation payloads in one pydantic-core call."""
+    return _CREATE_LIST_ADAPTER.validate_python(items)
+
+
+@dataclass(slots=True, frozen=True)
+class OrganizationReadSlim:
+    """Slotted, immutable view of an OrganizationRead for internal caching.
+
+    Drops the per-instance ``__dict__`` and pydantic bookkeeping of the full
+    model; convert back with ``to_read`` before returning it to clients.
+    """
+    id: UUID
+    name: str
+    org_type: str
+    website: Optional[str]
+    description: Optional[str]
+    contact_person_id: Optional[UUID]
+    employee_count: Optional[int]
+    founded_year: Optional[int]
+    addresses: tuple
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_read(cls, read: OrganizationRead) -> OrganizationReadSlim:
+        """Snapshot an OrganizationRead (addresses become a tuple)."""
+        values = {name: getattr(read, name) for name in cls.__slots__}
+        values["addresses"] = tuple(read.addresses)
+        return cls(**values)
+
+    def to_read(self) -> OrganizationRead:
+        """Rebuild the full model without re-validating the stored values."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        return OrganizationRead.model_construct(**values)
+
+
+def resolve_models() -> None:
+    """Bind ``AddressBase`` so the deferred model builds can resolve it.
+
+    Runs at import unless LAZY_MODELS is set; lazy deployments must call it
+    before first use (main.py does so before declaring its routes). The core
+    schemas themselves are still built on first validation. Calling it again
+    is harmless.
+    """
+    global AddressBase
+    from .address import AddressBase
+
+
+if not os.environ.get("LAZY_MODELS"):
+    resolve_models()
+
+
+@dataclass(slots=True)
+class OrganizationColumnar:
+    """Column-per-field copy of many organizations for bulk analytics.
+
+    Missing ``employee_count`` / ``founded_year`` values are stored as -1.
+    numpy is only imported when a column store is built, so the API service
+    does not depend on it.
+    """
+    ids: np.ndarray              # dtype=object (UUID)
+    names: np.ndarray            # dtype=object
+    org_types: np.ndarray        # dtype="U16"
+    employee_counts: np.ndarray  # dtype=int64
+    founded_years: np.ndarray    # dtype=int16
+
+    @classmethod
+    def from_reads(cls, reads: List[OrganizationRead]) -> OrganizationColumnar:
+        import numpy as np
+
+        n = len(reads)
+        ids = np.empty(n, dtype=object)
+        ids[:] = [r.id for r in reads]
+        names = np.empty(n, dtype=object)
+        names[:] = [r.name for r in reads]
+        return cls(
+            ids=ids,
+            names=names,
+            org_types=np.array([r.org_type for r in reads], dtype="U16"),
+            employee_counts=np.fromiter(
+                (-1 if r.employee_count is None else r.employee_count for r in reads),
+                dtype=np.int64,
+                count=n,
+            ),
+            founded_years=np.fromiter(
+                (-1 if r.founded_year is None else r.founded_year for r in reads),
+                dtype=np.int16,
+                count=n,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
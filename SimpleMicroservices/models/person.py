@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from typing import Optional, List, Annotated
 from uuid import UUID, uuid4
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from pydantic import BaseModel, Field, EmailStr, StringConstraints
 
-from .address import AddressBase
+from .address import AddressBase, AddressSetsMixin
 
 # Columbia UNI: 2–3 lowercase letters + 1–4 digits (e.g., abc1234)
 UNIType = Annotated[str, StringConstraints(pattern=r"^[a-z]{2,3}\d{1,4}$")]
@@ -164,7 +164,7 @@ class PersonUpdate(BaseModel):
     }
 
 
-class PersonRead(PersonBase):
+class PersonRead(PersonBase, AddressSetsMixin):
     """Server representation returned to clients."""
     id: UUID = Field(
         default_factory=uuid4,
@@ -172,12 +172,12 @@ class PersonRead(PersonBase):
         json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )